@@ -59,4 +59,15 @@ async def create_equipment(equipment: EquipmentCreate):
     # Insert into database
     await db.equipment.insert_one(new_equipment.dict())
     
-    return new_equipment
\ No newline at end of file
+    return new_equipment
+
+@router.delete("/{equipment_id}")
+async def delete_equipment(equipment_id: str):
+    """Delete an equipment item"""
+    db = await get_database()
+    
+    result = await db.equipment.delete_one({"id": equipment_id})
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Equipment not found")
+    
+    return {"message": "Equipment deleted successfully"}
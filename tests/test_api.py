@@ -0,0 +1,525 @@
+#!/usr/bin/env python3
+# Integration tests for the Inazuma Eleven Victory Road API. Shared state
+# (session, reference data, created resources) lives in session-scoped
+# fixtures, so any test can run on its own or under `pytest -n auto`.
+import requests
+from requests.adapters import HTTPAdapter
+import pytest
+import json
+import re
+import socket
+import copy
+from pathlib import Path
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor
+from hypothesis import given, settings, strategies as st
+
+# The backend URL is read from the frontend .env file
+ENV_FILE = Path('/app/frontend/.env')
+
+# Upper bound on in-flight requests; the connection pool is sized to match so
+# concurrent GETs each reuse a kept-alive connection instead of opening and
+# discarding extra ones
+MAX_PARALLEL_REQUESTS = 8
+
+# Fixed upload payload for the Excel import test
+CHARACTERS_XLSX = Path(__file__).parent / "fixtures" / "characters.xlsx"
+
+# Sample character data for testing
+SAMPLE_CHARACTER = {
+    "name": "Axel Blaze",
+    "nickname": "Fire Striker",
+    "title": "Ace Striker",
+    "base_level": 99,
+    "base_rarity": "Legendary",
+    "position": "FW",
+    "element": "Fire",
+    "jersey_number": 10,
+    "description": "A legendary striker with powerful fire shots",
+    "base_stats": {
+        "kick": {"main": 95, "secondary": 100},
+        "control": {"main": 85, "secondary": 90},
+        "technique": {"main": 90, "secondary": 95},
+        "intelligence": {"main": 80, "secondary": 85},
+        "pressure": {"main": 75, "secondary": 80},
+        "agility": {"main": 85, "secondary": 90},
+        "physical": {"main": 80, "secondary": 85}
+    },
+    "hissatsu": [
+        {
+            "name": "Fire Tornado",
+            "description": "A powerful shot that creates a tornado of fire",
+            "type": "Shot"
+        },
+        {
+            "name": "Flame Dance",
+            "description": "A dribbling technique that leaves a trail of fire",
+            "type": "Dribble"
+        }
+    ],
+    "team_passives": [
+        {
+            "name": "Fire Spirit",
+            "description": "Boosts team's fire element attacks"
+        },
+        {
+            "name": "Striker's Instinct",
+            "description": "Increases shot power for all forwards"
+        }
+    ]
+}
+
+# Sample team data for testing
+SAMPLE_TEAM_TEMPLATE = {
+    "name": "Raimon Eleven",
+    "formation_id": "1",  # Will be updated after getting formations
+    "tactics": [],  # Will be updated after getting tactics
+    "coach_id": None,  # Will be updated after getting coaches
+    "players": []  # Will be populated after creating characters
+}
+
+# Sample equipment data for testing
+SAMPLE_EQUIPMENT = {
+    "name": "Lightning Boots",
+    "rarity": "Legendary",
+    "category": "Boots",
+    "stats": {
+        "kick": 20,
+        "agility": 15
+    },
+    "description": "Boots that enhance kicking power and agility"
+}
+
+def encode_body(payload):
+    """Serialize a POST body as compact JSON bytes (no whitespace after separators)"""
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+# Static POST bodies, serialized once at import instead of on every request
+SAMPLE_CHARACTER_BODY = encode_body(SAMPLE_CHARACTER)
+SAMPLE_EQUIPMENT_BODY = encode_body(SAMPLE_EQUIPMENT)
+STATUS_BODY = encode_body({"client_name": "Test Client"})
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Static reference data every test case can rely on
+REFERENCE_ENDPOINTS = {
+    "formations": "/teams/formations/",
+    "tactics": "/teams/tactics/",
+    "coaches": "/teams/coaches/",
+}
+
+# Read-only endpoints with no data dependencies; fetched concurrently up front
+READ_ONLY_ENDPOINTS = {
+    "root": "/",
+    "characters": "/characters/",
+    "stats_summary": "/characters/stats/summary",
+    "equipment": "/equipment/",
+}
+
+# Generated payloads for the create -> read round-trip properties
+STAT_NAMES = ["kick", "control", "technique", "intelligence", "pressure", "agility", "physical"]
+text_strategy = st.text(st.characters(exclude_categories=("Cs", "Cc")), min_size=1, max_size=40)
+character_strategy = st.fixed_dictionaries({
+    "name": text_strategy,
+    "nickname": text_strategy,
+    "title": text_strategy,
+    "base_level": st.integers(1, 99),
+    "base_rarity": st.sampled_from(["Common", "Rare", "Epic", "Legendary"]),
+    "position": st.sampled_from(["FW", "MF", "DF", "GK"]),
+    "element": st.sampled_from(["Fire", "Earth", "Air", "Wood", "Void"]),
+    "jersey_number": st.integers(1, 99),
+    "description": text_strategy,
+    "base_stats": st.fixed_dictionaries({
+        name: st.fixed_dictionaries({"main": st.integers(0, 100), "secondary": st.integers(0, 100)})
+        for name in STAT_NAMES
+    }),
+})
+equipment_strategy = st.fixed_dictionaries({
+    "name": text_strategy,
+    "rarity": st.sampled_from(["Common", "Rare", "Epic", "Legendary"]),
+    "category": st.sampled_from(["Boots", "Bracelet", "Pendant", "Special"]),
+    "stats": st.dictionaries(st.sampled_from(STAT_NAMES), st.integers(0, 50), max_size=3),
+    "description": text_strategy,
+})
+
+class PinnedHostAdapter(HTTPAdapter):
+    """HTTPAdapter for URLs that address the backend by IP
+    
+    TLS still sends the real hostname for SNI and checks the certificate
+    against it, so a pre-resolved address needs no further DNS lookups.
+    Only used for direct connections; proxied runs keep the hostname URL.
+    """
+    
+    def __init__(self, hostname, *args, **kwargs):
+        # Set before super().__init__, which builds the pool manager
+        self.hostname = hostname
+        super().__init__(*args, **kwargs)
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["server_hostname"] = self.hostname
+        kwargs["assert_hostname"] = self.hostname
+        super().init_poolmanager(*args, **kwargs)
+
+
+# Fixtures
+
+@pytest.fixture(scope="session")
+def backend_url():
+    """Backend URL from the frontend .env file"""
+    if not ENV_FILE.exists():
+        pytest.skip(f"{ENV_FILE} not found; no backend to test against")
+    
+    match = re.search(r'^REACT_APP_BACKEND_URL=(.+)$', ENV_FILE.read_text(), re.MULTILINE)
+    if match is None:
+        pytest.fail(f"REACT_APP_BACKEND_URL not set in {ENV_FILE}")
+    
+    # Ensure the URL isn't quoted and doesn't have trailing slash
+    return match.group(1).strip().strip('"\'').rstrip('/')
+
+@pytest.fixture(scope="session")
+def backend_address(backend_url):
+    """Backend IP, resolved once per process instead of per connection
+    
+    Returns None, leaving the hostname in the URL, when the backend is
+    reached through a proxy (the proxy does its own lookup, and NO_PROXY
+    matching and proxied TLS checks need the hostname) or when it has no
+    IPv4 address, since gethostbyname cannot resolve IPv6 literals or
+    IPv6-only hosts.
+    """
+    if requests.utils.get_environ_proxies(backend_url):
+        return None
+    try:
+        return socket.gethostbyname(urlsplit(backend_url).hostname)
+    except socket.gaierror:
+        return None
+
+@pytest.fixture(scope="session")
+def api_url(backend_url, backend_address):
+    """Base URL of the API, with the /api prefix, pinned to the resolved IP if any"""
+    if backend_address is None:
+        url = f"{backend_url}/api"
+        print(f"Testing API at: {url}")
+        return url
+    
+    parts = urlsplit(backend_url)
+    # IPv6 addresses must be bracketed inside a URL
+    host = f"[{backend_address}]" if ":" in backend_address else backend_address
+    netloc = host if parts.port is None else f"{host}:{parts.port}"
+    url = f"{parts._replace(netloc=netloc).geturl()}/api"
+    print(f"Testing API at: {backend_url}/api ({backend_address})")
+    return url
+
+@pytest.fixture(scope="session")
+def api_session(backend_url, backend_address):
+    """One keep-alive session shared by every test"""
+    session = requests.Session()
+    if backend_address is None:
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=MAX_PARALLEL_REQUESTS)
+    else:
+        parts = urlsplit(backend_url)
+        # Requests go to the pinned IP, so name the virtual host explicitly
+        session.headers["Host"] = parts.netloc
+        adapter = PinnedHostAdapter(parts.hostname, pool_connections=4, pool_maxsize=MAX_PARALLEL_REQUESTS)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    yield session
+    session.close()
+
+@pytest.fixture(scope="session")
+def fetch_all(api_session, api_url):
+    """GET several API paths concurrently, returning responses in order"""
+    def fetch(paths):
+        with ThreadPoolExecutor(max_workers=min(len(paths), MAX_PARALLEL_REQUESTS)) as executor:
+            return list(executor.map(lambda path: api_session.get(f"{api_url}{path}"), paths))
+    return fetch
+
+@pytest.fixture(scope="session")
+def prefetched(fetch_all):
+    """Responses of the read-only endpoints, fetched together up front"""
+    # Overlap the independent GETs so their latency is max, not sum
+    return dict(zip(READ_ONLY_ENDPOINTS, fetch_all(list(READ_ONLY_ENDPOINTS.values()))))
+
+@pytest.fixture(scope="session")
+def reference_data(fetch_all):
+    """Formations, tactics and coaches responses; static, so fetched once per process"""
+    return dict(zip(REFERENCE_ENDPOINTS, fetch_all(list(REFERENCE_ENDPOINTS.values()))))
+
+@pytest.fixture(scope="session")
+def created_character(api_session, api_url):
+    """The sample character, created once and shared by dependent tests"""
+    response = api_session.post(f"{api_url}/characters/", data=SAMPLE_CHARACTER_BODY, headers=JSON_HEADERS)
+    assert response.status_code == 200
+    return response.json()
+
+@pytest.fixture(scope="session")
+def created_team(api_session, api_url, reference_data, created_character):
+    """A team built from real reference IDs and the created character"""
+    # A broken reference endpoint is a failure here, not a reason to skip
+    for name, response in reference_data.items():
+        assert response.status_code == 200, f"GET {REFERENCE_ENDPOINTS[name]} returned {response.status_code}"
+    
+    # Fill a copy of the sample team with real IDs
+    team = copy.deepcopy(SAMPLE_TEAM_TEMPLATE)
+    team["formation_id"] = reference_data["formations"].json()[0]["id"]
+    team["tactics"] = [tactic["id"] for tactic in reference_data["tactics"].json()[:2]]
+    team["coach_id"] = reference_data["coaches"].json()[0]["id"]
+    team["players"] = [
+        {
+            "character_id": created_character["id"],
+            "position_id": "lf",  # Left forward position from formation
+            "user_level": 99,
+            "user_rarity": "Legendary"
+        }
+    ]
+    
+    response = api_session.post(f"{api_url}/teams/", json=team)
+    assert response.status_code == 200
+    return response.json()
+
+@pytest.fixture(scope="session")
+def created_equipment(api_session, api_url):
+    """The sample equipment item, created once and shared by dependent tests"""
+    response = api_session.post(f"{api_url}/equipment/", data=SAMPLE_EQUIPMENT_BODY, headers=JSON_HEADERS)
+    assert response.status_code == 200
+    return response.json()
+
+def check_round_trip(api_session, api_url, collection, payload):
+    """POST payload to a collection, check it reads back unchanged by ID, then delete it
+    
+    The delete runs even when the check fails, so examples Hypothesis
+    generates or shrinks leave no records behind.
+    """
+    response = api_session.post(f"{api_url}{collection}", data=encode_body(payload), headers=JSON_HEADERS)
+    assert response.status_code == 200
+    item_id = response.json()["id"]
+    item_url = f"{api_url}{collection}{item_id}"
+    
+    try:
+        response = api_session.get(item_url)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] == item_id
+        for key, value in payload.items():
+            assert data[key] == value
+        print(f"✅ GET {collection}{item_id} working")
+    finally:
+        api_session.delete(item_url)
+
+def test_01_api_root(prefetched):
+    """Test API root endpoint"""
+    response = prefetched["root"]
+    assert response.status_code == 200
+    data = response.json()
+    assert "message" in data
+    print("✅ API root endpoint working")
+
+def test_02_status_endpoint(api_session, api_url):
+    """Test status endpoint"""
+    # Create status check
+    response = api_session.post(f"{api_url}/status", data=STATUS_BODY, headers=JSON_HEADERS)
+    assert response.status_code == 200
+    data = response.json()
+    assert "id" in data
+    assert data["client_name"] == "Test Client"
+    
+    # Get status checks
+    response = api_session.get(f"{api_url}/status")
+    assert response.status_code == 200
+    data = response.json()
+    assert isinstance(data, list)
+    print("✅ Status endpoints working")
+
+# Characters API Tests
+
+def test_03_get_characters_empty(prefetched):
+    """Test getting characters (initially empty)"""
+    response = prefetched["characters"]
+    assert response.status_code == 200
+    data = response.json()
+    assert isinstance(data, list)
+    print(f"✅ GET /characters/ returned {len(data)} characters")
+
+def test_04_create_character(created_character):
+    """Test creating a character"""
+    assert "id" in created_character
+    assert created_character["name"] == SAMPLE_CHARACTER["name"]
+    assert created_character["position"] == SAMPLE_CHARACTER["position"]
+    assert created_character["element"] == SAMPLE_CHARACTER["element"]
+    print(f"✅ Created character with ID: {created_character['id']}")
+
+@settings(max_examples=5, deadline=None)
+@given(character=character_strategy)
+def test_05_character_round_trip(api_session, api_url, character):
+    """Test that any created character reads back unchanged by ID"""
+    check_round_trip(api_session, api_url, "/characters/", character)
+
+def test_06_combined_filters(api_session, api_url, created_character):
+    """Test position, element and search filters together in one request"""
+    response = api_session.get(f"{api_url}/characters/?position=FW&element=Fire&search=Blaze")
+    assert response.status_code == 200
+    data = response.json()
+    assert isinstance(data, list)
+    
+    # Filters are ANDed; the created FW/Fire "Axel Blaze" guarantees a match
+    assert len(data) > 0
+    for character in data:
+        assert character["position"] == "FW"
+        assert character["element"] == "Fire"
+        assert "blaze" in f"{character['name']} {character['nickname']}".lower()
+    
+    print("✅ Character filtering working")
+
+def test_07_character_stats_summary(prefetched):
+    """Test character statistics summary"""
+    response = prefetched["stats_summary"]
+    assert response.status_code == 200
+    data = response.json()
+    assert "total_characters" in data
+    assert "by_position" in data
+    assert "by_element" in data
+    assert "by_rarity" in data
+    print("✅ Character statistics summary working")
+
+def test_08_import_characters_excel(api_session, api_url):
+    """Test importing characters from Excel"""
+    # Two-row sheet (Mark Evans, Jude Sharp) pre-generated with pandas
+    excel_bytes = CHARACTERS_XLSX.read_bytes()
+    
+    # Upload the Excel file
+    files = {'file': ('characters.xlsx', excel_bytes, 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')}
+    response = api_session.post(f"{api_url}/characters/import-excel", files=files)
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert "imported_count" in data
+    assert data["imported_count"] >= 1
+    print(f"✅ Imported {data['imported_count']} characters from Excel")
+
+# Teams API Tests
+
+def test_09_get_formations(reference_data):
+    """Test getting formations"""
+    response = reference_data["formations"]
+    assert response.status_code == 200
+    formations = response.json()
+    assert isinstance(formations, list)
+    assert len(formations) > 0
+    print(f"✅ GET /teams/formations/ returned {len(formations)} formations")
+
+def test_10_get_tactics(reference_data):
+    """Test getting tactics"""
+    response = reference_data["tactics"]
+    assert response.status_code == 200
+    tactics = response.json()
+    assert isinstance(tactics, list)
+    assert len(tactics) > 0
+    print(f"✅ GET /teams/tactics/ returned {len(tactics)} tactics")
+
+def test_11_get_coaches(reference_data):
+    """Test getting coaches"""
+    response = reference_data["coaches"]
+    assert response.status_code == 200
+    coaches = response.json()
+    assert isinstance(coaches, list)
+    assert len(coaches) > 0
+    print(f"✅ GET /teams/coaches/ returned {len(coaches)} coaches")
+
+def test_12_create_team(created_team):
+    """Test creating a team"""
+    assert "id" in created_team
+    assert created_team["name"] == SAMPLE_TEAM_TEMPLATE["name"]
+    print(f"✅ Created team with ID: {created_team['id']}")
+
+def test_13_get_teams(api_session, api_url):
+    """Test getting teams"""
+    response = api_session.get(f"{api_url}/teams/")
+    assert response.status_code == 200
+    data = response.json()
+    assert isinstance(data, list)
+    print(f"✅ GET /teams/ returned {len(data)} teams")
+
+def test_14_get_team_by_id(api_session, api_url, created_team):
+    """Test getting a specific team by ID"""
+    team_id = created_team["id"]
+    response = api_session.get(f"{api_url}/teams/{team_id}")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["id"] == team_id
+    assert data["name"] == SAMPLE_TEAM_TEMPLATE["name"]
+    print(f"✅ GET /teams/{team_id} working")
+
+# Equipment API Tests
+
+def test_15_get_equipment(prefetched):
+    """Test getting equipment"""
+    response = prefetched["equipment"]
+    assert response.status_code == 200
+    data = response.json()
+    assert isinstance(data, list)
+    assert len(data) > 0
+    print(f"✅ GET /equipment/ returned {len(data)} equipment items")
+
+def test_16_get_equipment_by_category(api_session, api_url):
+    """Test getting equipment by category"""
+    response = api_session.get(f"{api_url}/equipment/category/Boots")
+    assert response.status_code == 200
+    data = response.json()
+    assert isinstance(data, list)
+    if data:
+        assert data[0]["category"] == "Boots"
+    print(f"✅ GET /equipment/category/Boots returned {len(data)} items")
+
+def test_17_create_equipment(created_equipment):
+    """Test creating equipment"""
+    assert "id" in created_equipment
+    assert created_equipment["name"] == SAMPLE_EQUIPMENT["name"]
+    assert created_equipment["category"] == SAMPLE_EQUIPMENT["category"]
+    print(f"✅ Created equipment with ID: {created_equipment['id']}")
+
+@settings(max_examples=5, deadline=None)
+@given(equipment=equipment_strategy)
+def test_18_equipment_round_trip(api_session, api_url, equipment):
+    """Test that any created equipment item reads back unchanged by ID"""
+    check_round_trip(api_session, api_url, "/equipment/", equipment)
+
+def test_19_equipment_filtering(fetch_all):
+    """Test equipment filtering"""
+    category_response, rarity_response = fetch_all([
+        "/equipment/?category=Boots",
+        "/equipment/?rarity=Legendary",
+    ])
+    
+    # Test category filter
+    assert category_response.status_code == 200
+    data = category_response.json()
+    assert isinstance(data, list)
+    if data:
+        assert data[0]["category"] == "Boots"
+    
+    # Test rarity filter
+    assert rarity_response.status_code == 200
+    data = rarity_response.json()
+    assert isinstance(data, list)
+    if data:
+        assert data[0]["rarity"] == "Legendary"
+    
+    print("✅ Equipment filtering working")
+
+def test_20_delete_equipment(api_session, api_url):
+    """Test deleting an equipment item, then deleting it again"""
+    response = api_session.post(f"{api_url}/equipment/", data=SAMPLE_EQUIPMENT_BODY, headers=JSON_HEADERS)
+    assert response.status_code == 200
+    equipment_id = response.json()["id"]
+    
+    response = api_session.delete(f"{api_url}/equipment/{equipment_id}")
+    assert response.status_code == 200
+    
+    # The item is gone, and a second delete reports it missing
+    response = api_session.get(f"{api_url}/equipment/{equipment_id}")
+    assert response.status_code == 404
+    response = api_session.delete(f"{api_url}/equipment/{equipment_id}")
+    assert response.status_code == 404
+    print(f"✅ DELETE /equipment/{equipment_id} working")
+
+if __name__ == "__main__":
+    # Run the tests
+    raise SystemExit(pytest.main([__file__]))